@@ -45,6 +45,14 @@ class InferConfig(CommandConfig):
                         (unconstrained)."""
         )
 
+        parser.add_argument(
+            "--batch-size", "-b",
+            dest =      "batch_size",
+            type =      int,
+            default =   8,
+            help =      """Number of samples generated per batched model call. Defaults to 8."""
+        )
+
         parser.add_argument(
             "--output",
             dest =      "output_path",
@@ -5,7 +5,7 @@ Main process entry point for infer command.
 
 __all__ = ["infer_entry_point"]
 
-from typing                         import Any, Dict, List, Optional
+from typing                         import Any, Dict, List, Optional, Tuple
 
 from parcus.commands.infer.__args__ import InferConfig
 from parcus.registration            import register_command
@@ -18,6 +18,7 @@ def infer_entry_point(
     model_id:       str,
     dataset_id:     str,
     token_budget:   Optional[List[int]] =   None,
+    batch_size:     int =                   8,
     output_path:    str =                   "output",
     seed:           int =                   1,
     *args,
@@ -28,21 +29,25 @@ def infer_entry_point(
     ## Args:
         * model_id    (str):                Model family identifier (e.g. "qwen").
         * dataset_id    (str):              Dataset identifier (e.g. "gsm8k").
-        * token_budget  (List[int] | None): List of token budgets to evaluate. None for 
+        * token_budget  (List[int] | None): List of token budgets to evaluate. None for
                                             unconstrained.
+        * batch_size    (int):              Number of samples generated per batched model call.
+                                            Defaults to 8.
         * output_path   (str):              Root path for results. Defaults to "output".
         * seed          (int):              Random number generation seed. Defaults to 1.
     """
-    from json                   import dump
+    from contextlib             import ExitStack
+    from json                   import dumps
     from logging                import Logger
     from pathlib                import Path
+    from typing                 import IO
 
     from tqdm                   import tqdm
 
-    from parcus.datasets        import Dataset
+    from parcus.datasets        import Dataset, Sample
     from parcus.models          import Model
     from parcus.registration    import DATASET_REGISTRY, MODEL_REGISTRY
-    from parcus.utilities       import get_logger, set_hugging_face_token, set_seed
+    from parcus.utilities       import dump_json, get_logger, set_hugging_face_token, set_seed
 
     # Initialize logger.
     logger: Logger =    get_logger("infer-process")
@@ -67,86 +72,138 @@ def infer_entry_point(
                             dataset.id / dataset.subset / dataset._split_
 
     # Normalize budgets: None → [None] (unconstrained), else the provided list.
-    budgets:    List[int] = token_budget
-
-    # For each token budget...
-    for budget in budgets:
-
-        # Log configuration.
-        logger.info(
-            f"Infer process initiated ("
-            f"model = {model_id}, "
-            f"dataset = {dataset_id}, "
-            f"budget(s) = {budget}, "
-            f"seed = {seed})"
+    budgets:    List[Optional[int]] =   token_budget if token_budget is not None else [None]
+
+    # Materialize samples once, so prompts & ground truths are formatted a single time rather
+    # than once per budget (iterating the dataset builds fresh Sample objects each pass).
+    sample_set:     List[Sample] =      list(dataset)
+
+    # Record sample count.
+    num_samples:    int =               len(sample_set)
+
+    # Ensure output directory exists.
+    output_dir.mkdir(parents = True, exist_ok = True)
+
+    # Log configuration.
+    logger.info(
+        f"Infer process initiated ("
+        f"model = {model_id}, "
+        f"dataset = {dataset_id}, "
+        f"budget(s) = {budgets}, "
+        f"seed = {seed})"
+    )
+
+    # Derive budget labels for file naming.
+    budget_labels:  Dict[Optional[int], str] =  {
+                                                    budget: str(budget)             \
+                                                            if budget is not None   \
+                                                            else "unconstrained"
+                                                    for budget
+                                                    in  budgets
+                                                }
+
+    # Initialize running correct-answer counts per budget.
+    num_correct:    Dict[Optional[int], int] =  {budget: 0 for budget in budgets}
+
+    # Resolve per-budget sample result paths.
+    samples_files:  Dict[Optional[int], Path] = {
+                                                    budget: output_dir /
+                                                            f"{label}-token-budget.jsonl"
+                                                    for budget, label
+                                                    in  budget_labels.items()
+                                                }
+
+    # Open every budget's sample results file, to which records are streamed as they are
+    # produced. This bounds memory to the current batch and preserves partial results on
+    # interruption.
+    with ExitStack() as stack:
+
+        # Open sample result files.
+        samples_out:    Dict[Optional[int], IO] =   {
+                                                        budget: stack.enter_context(open(
+                                                                    path,
+                                                                    "w",
+                                                                    encoding = "utf-8"
+                                                                ))
+                                                        for budget, path
+                                                        in  samples_files.items()
+                                                    }
+
+        # Initialize progress bar.
+        progress:       tqdm =                      stack.enter_context(tqdm(
+                                                        total = num_samples,
+                                                        leave = True,
+                                                        unit =  "sample(s)",
+                                                        desc =  "Infering samples"
+                                                    ))
+
+        # For each batch of samples...
+        for start in range(0, num_samples, batch_size):
+
+            # Slice batch.
+            batch:  List[Sample] =                  sample_set[start:start + batch_size]
+
+            # Sweep every budget in one batched generation (greedy decoding is
+            # prefix-deterministic, so smaller budgets fall out of the largest by truncation).
+            sweep:  Dict[Optional[int],
+                         List[Tuple[str, int, int]]] =  model.generate_batch_sweep(
+                                                            prompts =   [s.prompt for s in batch],
+                                                            budgets =   budgets
+                                                        )
+
+            # For each budget's results...
+            for budget, results in sweep.items():
+
+                # For each sample & its generation result...
+                for offset, (sample, (response, prompt_tokens, response_tokens)) \
+                in enumerate(zip(batch, results)):
+
+                    # Extract model's answer.
+                    extracted:  Optional[str] =     dataset.extract_answer(response = response)
+
+                    # Grade response.
+                    correct:    bool =              dataset.evaluate_answer(
+                                                        answer =        extracted,
+                                                        ground_truth =  sample.ground_truth
+                                                    )
+
+                    # Tally correct answers as they are graded.
+                    num_correct[budget] +=          correct
+
+                    # Stream sample result to disk.
+                    samples_out[budget].write(dumps(
+                        obj =           {
+                                            "id":               start + offset,
+                                            "prompt":           sample.prompt,
+                                            "prompt_tokens":    prompt_tokens,
+                                            "ground_truth":     sample.ground_truth,
+                                            "response":         response,
+                                            "response_tokens":  response_tokens,
+                                            "extracted":        extracted,
+                                            "correct":          correct
+                                        },
+                        ensure_ascii =  False
+                    ) + "\n")
+
+            # Advance progress bar by the batch just graded.
+            progress.update(len(batch))
+
+    # For each budget...
+    for budget, label in budget_labels.items():
+
+        # Compute accuracy from the running tally.
+        accuracy:   float = round(num_correct[budget] / num_samples, 6) if num_samples > 0 else 0.0
+
+        # Write run summary.
+        dump_json(
+            obj =   {
+                        "model":        model.id,
+                        "dataset":      dataset.id,
+                        "budget":       label,
+                        "num_samples":  num_samples,
+                        "seed":         seed,
+                        "accuracy":     accuracy,
+                        "samples":      samples_files[budget].name,
+                    },
+            path =  output_dir / f"{label}-token-budget.json"
         )
-
-        # Derive budget label for logging and file naming.
-        budget_label:   str =                       str(budget)             \
-                                                    if budget is not None   \
-                                                    else "unconstrained"
-
-        # Initialize sample results.
-        samples:        Dict[str, Dict[str, Any]] = {}
-
-        # For each sample in the dataset...
-        for s, sample in enumerate(tqdm(
-            iterable =  dataset,
-            leave =     True,
-            unit =      "sample(s)",
-            desc =      "Infering samples"
-        )):
-
-            # Generate response.
-            (response,
-             prompt_tokens,
-             response_tokens) =             model.generate(prompt = sample.prompt, budget = budget)
-
-            # Extract model's answer.
-            extracted:  Optional[str] =     dataset.extract_answer(response = response)
-            
-            # Grade response.
-            correct:    bool =              dataset.evaluate_answer(
-                                                answer =        extracted,
-                                                ground_truth =  sample.ground_truth
-                                            )
-
-            # Record sample result.
-            samples[str(s)] =               {
-                                                "prompt":           sample.prompt,
-                                                "prompt_tokens":    prompt_tokens,
-                                                "ground_truth":     sample.ground_truth,
-                                                "response":         response,
-                                                "response_tokens":  response_tokens,
-                                                "extracted":        extracted,
-                                                "correct":          correct
-                                            }
-
-        # Ensure output directory exists.
-        output_dir.mkdir(parents = True, exist_ok = True)
-
-        # Resolve output file path.
-        output_file:    Path =  output_dir / f"{budget_label}-token-budget.json"
-
-        # Compute accuracy.
-        num_correct:    int =   sum(1 for s in samples.values() if s["correct"])
-        num_samples:    int =   len(samples)
-        accuracy:       float = round(num_correct / num_samples, 6) if num_samples > 0 else 0.0
-
-        # Open results file.
-        with open(output_file, "w", encoding = "utf-8") as f:
-
-            # Write results.
-            dump(
-                obj =           {
-                                    "model":        model.id,
-                                    "dataset":      dataset.id,
-                                    "budget":       budget_label,
-                                    "num_samples":  dataset.num_samples,
-                                    "seed":         seed,
-                                    "samples":      samples,
-                                },
-                fp =            f,
-                indent =        2,
-                ensure_ascii =  False,
-            )
\ No newline at end of file
@@ -59,6 +59,15 @@ class ModelConfig(Config):
             help =      """Load model using 4-bit quantization."""
         )
 
+        parser.add_argument(
+            "--compile",
+            dest =      "compile_model",
+            action =    "store_true",
+            default =   False,
+            help =      """Compile model with TorchInductor for fused decode kernels (first
+                        generations pay a warm-up compile)."""
+        )
+
         parser.add_argument(
             "--offload-path",
             dest =      "offload_path",
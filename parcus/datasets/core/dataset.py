@@ -6,15 +6,48 @@ Abstract dataset protocol.
 __all__ = ["Dataset"]
 
 from abc                            import ABC, abstractmethod
+from functools                      import lru_cache
 from logging                        import Logger
-from re                             import Match, search
-from typing                         import Iterator, List, Optional, Type
-
-from datasets                       import Dataset as hf_Dataset, load_dataset
+from re                             import compile as re_compile, Match, Pattern
+from typing                         import Iterator, List, Optional, Type, TYPE_CHECKING
 
 from parcus.datasets.core.sample    import Sample
 from parcus.utilities               import get_logger
 
+# Defer until runtime (importing datasets pulls in the Arrow stack, which commands that never
+# load data should not pay for).
+if TYPE_CHECKING:
+    from datasets                   import Dataset as hf_Dataset
+
+# Compiled once at import, so per-response extraction skips the re module's cache probing.
+_ANSWER_PATTERN_:   Pattern =   re_compile(r"####\s*([A-D]|-?\d[\d,\.]*)")
+
+
+@lru_cache(maxsize = 4)
+def _load_cached_(
+    path:   str,
+    subset: Optional[str],
+    split:  Optional[str]
+) -> "hf_Dataset":
+    """# Load HuggingFace Dataset (Memoized).
+
+    Repeat loads of the same path/subset/split within a process skip Arrow re-materialization
+    entirely; the split is pinned in memory on first load.
+
+    ## Args:
+        * path      (str):  HuggingFace path from which dataset can be loaded.
+        * subset    (str):  Dataset subset being loaded.
+        * split     (str):  Dataset split being loaded.
+
+    ## Returns:
+        * hf_Dataset:   Loaded dataset split.
+    """
+    from datasets import load_dataset
+
+    # Load & pin split.
+    return load_dataset(path = path, name = subset, split = split, keep_in_memory = True)
+
+
 class Dataset(ABC):
     """# Hugging Face Dataset Wrapper"""
 
@@ -46,11 +79,11 @@ class Dataset(ABC):
         # Log initialization.
         self.__logger__.info(f"Loading {path} (subset = {subset}, split = {split})")
 
-        # Load dataset from HuggingFace.
-        self._data_:        hf_Dataset =    load_dataset(
-                                                path =  self._path_,
-                                                name =  self._subset_,
-                                                split = self._split_
+        # Load dataset from HuggingFace (memoized per path/subset/split).
+        self._data_:        "hf_Dataset" =  _load_cached_(
+                                                path =      self._path_,
+                                                subset =    self._subset_,
+                                                split =     self._split_
                                             )
         
         # If a specific number of samples is required...
@@ -65,7 +98,7 @@ class Dataset(ABC):
     # PROPERTIES ===================================================================================
 
     @property
-    def data(self) -> hf_Dataset:
+    def data(self) -> "hf_Dataset":
         """# Underlying HuggingFace Dataset"""
         return self._data_
     
@@ -118,8 +151,19 @@ class Dataset(ABC):
         # If no answer was extracted, no evaluation to be done.
         if answer is None: return False
 
-        # Otherwise, simply direct comparison.
-        return answer.strip().lower() == ground_truth.strip().lower()
+        # Normalize each side once.
+        extracted:  str =   answer.strip().lower()
+        expected:   str =   ground_truth.strip().lower()
+
+        # Fast path: exact match.
+        if extracted == expected: return True
+
+        # Otherwise, attempt exact integer comparison (e.g. "1,000" vs "1000"), which is precise
+        # at any magnitude where float conversion would round.
+        try:                return int(extracted.replace(",", "")) == int(expected.replace(",", ""))
+
+        # Non-numeric answers that failed the direct comparison simply don't match.
+        except ValueError:  return False
 
     def extract_answer(self,
         response:   str
@@ -133,7 +177,7 @@ class Dataset(ABC):
             * Optional[str]:    Extracted answer if found.
         """
         # Search for answer in response.
-        answer: Match = search(pattern = r"####\s*([A-D]|-?\d[\d,\.]*)", string = response)
+        answer: Match = _ANSWER_PATTERN_.search(string = response)
         
         # If a match is found, return the extracted answer.
         if answer: return answer.group(1).strip()
@@ -151,7 +195,11 @@ class Dataset(ABC):
     
     def __iter__(self) -> Iterator:
         """# Iterate Over Dataset."""
-        return iter(self._sample_cls_(s) for s in self._data_)
+        # Resolve sample class once, rather than once per sample.
+        sample_cls: Type[Sample] =  self._sample_cls_
+
+        # Iterate over wrapped samples.
+        return iter(sample_cls(s) for s in self._data_)
     
     def __len__(self) -> int:
         """# Number of Samples in Dataset"""
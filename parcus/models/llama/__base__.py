@@ -5,14 +5,16 @@ LLaMA model family.
 
 __all__ = ["Llama"]
 
-from typing                         import Literal, Optional, Union
-
-from torch                          import device as t_device
+from typing                         import Literal, Optional, TYPE_CHECKING, Union
 
 from parcus.models.protocol         import Model
 from parcus.models.llama.__args__   import LlamaConfig
 from parcus.registration            import register_model
 
+# Defer until runtime.
+if TYPE_CHECKING:
+    from torch                      import device as t_device
+
 
 # Fixed LLaMA version for each parameter count.
 _VERSIONS_ = {
@@ -45,7 +47,8 @@ class Llama(Model):
         max_memory:     Optional[int] =                     None,
         load_in_4bit:   bool =                              False,
         offload_path:   str =                               "offload",
-        device:         Union[str, t_device] =              "auto",
+        device:         Union[str, "t_device"] =            "auto",
+        compile_model:  bool =                              False,
         **kwargs
     ):
         """# Instantiate LLaMA Model.
@@ -56,6 +59,7 @@ class Llama(Model):
             * load_in_4bit  (bool):             Load model using 4-bit quantization.
             * offload_path  (str):              Folder for model offloads to share CPU RAM.
             * device        (str | device):     Torch device. Defaults to "auto".
+            * compile_model (bool):             Compile model for fused decode kernels.
         """
         # Resolve version from parameter count.
         version:    str =   _VERSIONS_[parameter_qty]
@@ -67,5 +71,6 @@ class Llama(Model):
             max_memory =    max_memory,
             load_in_4bit =  load_in_4bit,
             offload_path =  offload_path,
-            device =        device
+            device =        device,
+            compile_model = compile_model
         )
\ No newline at end of file
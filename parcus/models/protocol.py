@@ -6,15 +6,50 @@ Abstract model protocol.
 __all__ = ["Model"]
 
 from abc                import ABC
+from functools          import wraps
 from logging            import Logger
-from typing             import Any, Dict, Optional, Tuple, Union
-
-from torch              import device as t_device, float16, no_grad, Tensor
-from transformers       import AutoModelForCausalLM, AutoTokenizer, PreTrainedModel, \
-                               PreTrainedTokenizerBase
+from typing             import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 from parcus.utilities   import determine_device, get_logger
 
+# Defer until runtime (importing torch & transformers costs seconds cold, and commands that never
+# load a model should not pay it).
+if TYPE_CHECKING:
+    from torch          import device as t_device, dtype as t_dtype, Tensor
+    from transformers   import PreTrainedModel, PreTrainedTokenizerBase
+
+# Track whether TF32 tensor-core paths have been enabled, so repeat model loads skip the
+# process-global configuration.
+_tf32_configured_:  bool =  False
+
+
+def _inference_mode_(
+    method: Callable
+) -> Callable:
+    """# Run Method Under torch.inference_mode.
+
+    Deferred stand-in for decorating with torch.inference_mode directly, which would force the
+    torch import at class-definition (i.e. package-import) time.
+
+    ## Args:
+        * method    (Callable): Generation method being wrapped.
+
+    ## Returns:
+        * Callable: Method wrapped in an inference-mode context.
+    """
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+
+        # Import context manager.
+        from torch import inference_mode
+
+        # Execute method under inference mode.
+        with inference_mode(): return method(*args, **kwargs)
+
+    # Provide wrapped method.
+    return wrapper
+
+
 class Model(ABC):
     """# Hugging Face Model Wrapper"""
 
@@ -24,31 +59,64 @@ class Model(ABC):
         max_memory:     Optional[int] =         None,
         load_in_4bit:   bool =                  False,
         offload_path:   str =                   "offload",
-        device:         Union[str, t_device] =  "auto"
+        device:         Union[str, "t_device"] =    "auto",
+        compile_model:  bool =                      False
     ):
         """# Instantiate Model.
 
         ## Args:
             * id            (str):              Model identifier.
             * path          (str):              HuggingFace AP path for model loading.
-            * max_memory    (int):              Limit GPU usage to a vertain number of GB. Defaults 
+            * max_memory    (int):              Limit GPU usage to a vertain number of GB. Defaults
                                                 to None.
-            * load_in_4bit  (bool):             Load model using 4-bit quantization. Defaults to 
+            * load_in_4bit  (bool):             Load model using 4-bit quantization. Defaults to
                                                 False.
-            * offload_path  (str):              Folder for model offloads to share CPU RAM. Defaults 
+            * offload_path  (str):              Folder for model offloads to share CPU RAM. Defaults
                                                 to "offload".
             * device        (str | t_device):   Torch device. Defaults to "auto".
+            * compile_model (bool):             Compile model with TorchInductor for fused decode
+                                                kernels. Defaults to False.
         """
+        global _tf32_configured_
+
+        from torch          import bfloat16, cuda, float16
+        from transformers   import AutoModelForCausalLM, AutoTokenizer
+
         # Initialize logger.
         self.__logger__:    Logger =            get_logger(f"{id}-model")
 
+        # If a CUDA device is present & TF32 has not yet been enabled...
+        if cuda.is_available() and not _tf32_configured_:
+
+            # Import backend handles.
+            from torch.backends import cuda as cuda_backend, cudnn
+
+            # Allow TF32 tensor-core paths for matmuls & convolutions (Ampere+), so any FP32
+            # fallback layers run at tensor-core rather than FP32 throughput. cudnn.benchmark is
+            # deliberately left alone — set_seed pins it off for determinism.
+            cuda_backend.matmul.allow_tf32 =    True
+            cudnn.allow_tf32 =                  True
+
+            # Flag configuration as complete.
+            _tf32_configured_ =                 True
+
         # Define properties.
         self._id_:          str =               id
         self._path_:        str =               path
-        self._device_:      t_device =          determine_device(device)
+        self._device_:      "t_device" =        determine_device(device)
+
+        # Prefer bfloat16 where the hardware supports it (fp32 range at fp16 bandwidth, avoiding
+        # attention-softmax overflow on long contexts); otherwise fall back to float16.
+        dtype:              "t_dtype" =         bfloat16                        \
+                                                if cuda.is_available()          \
+                                                and cuda.is_bf16_supported()    \
+                                                else float16
+
+        # Request fused scaled-dot-product attention kernels alongside the resolved dtype.
         model_kwargs:       Dict[str, Any] =    {
-                                                    "device_map":   "auto",
-                                                    "dtype":        float16
+                                                    "device_map":           "auto",
+                                                    "dtype":                dtype,
+                                                    "attn_implementation":  "sdpa"
                                                 }
 
         # Log initialization.
@@ -74,7 +142,7 @@ class Model(ABC):
             model_kwargs["quantization_config"] =   BitsAndBytesConfig(
                                                         load_in_4bit=               True,
                                                         bnb_4bit_quant_type=        "nf4",
-                                                        bnb_4bit_compute_dtype=     float16,
+                                                        bnb_4bit_compute_dtype=     dtype,
                                                         bnb_4bit_use_double_quant=  True,
                                                     )
 
@@ -82,11 +150,41 @@ class Model(ABC):
             self.__logger__.info(f"4-bit quantization enabled")
 
         # Load model & tokenizer.
-        self._model_:       PreTrainedModel =           AutoModelForCausalLM.from_pretrained(
+        self._model_:       "PreTrainedModel" =         AutoModelForCausalLM.from_pretrained(
                                                             path,
                                                             **model_kwargs
                                                         )
-        self._tokenizer_:   PreTrainedTokenizerBase =   AutoTokenizer.from_pretrained(path)
+        self._tokenizer_:   "PreTrainedTokenizerBase" = AutoTokenizer.from_pretrained(path)
+
+        # If the tokenizer defines no padding token, reuse end-of-sequence.
+        if self._tokenizer_.pad_token is None:
+            self._tokenizer_.pad_token =                self._tokenizer_.eos_token
+
+        # Build greedy-decoding defaults once, with per-budget argument dicts cached lazily, so
+        # tight per-batch loops reuse one dict instead of rebuilding it every generate call.
+        self._gen_defaults_:        Dict[str, Any] =    {
+                                                            "do_sample":    False,
+                                                            "temperature":  None,
+                                                            "top_k":        None,
+                                                            "top_p":        None,
+                                                            "pad_token_id": self._tokenizer_
+                                                                                .pad_token_id
+                                                        }
+        self._gen_kwargs_cache_:    Dict[Optional[int],
+                                         Dict[str, Any]] =  {}
+
+        # If compilation is requested & a CUDA device is present...
+        if compile_model and cuda.is_available():
+
+            # Import compiler.
+            from torch import compile as t_compile
+
+            # Compile model (first generations pay a warm-up compile; subsequent decode steps run
+            # fused kernels with reduced Python dispatch overhead).
+            self._model_ =  t_compile(self._model_, mode = "reduce-overhead", fullgraph = False)
+
+            # Log compilation.
+            self.__logger__.info("Model compiled (mode = reduce-overhead)")
 
 
     # PROPERTIES ===================================================================================
@@ -97,7 +195,7 @@ class Model(ABC):
         return self._id_
     
     @property
-    def model(self) -> PreTrainedModel:
+    def model(self) -> "PreTrainedModel":
         """# Underlying HuggingFace Model"""
         return self._model_
 
@@ -107,13 +205,13 @@ class Model(ABC):
         return self._path_
     
     @property
-    def tokenizer(self) -> PreTrainedTokenizerBase:
+    def tokenizer(self) -> "PreTrainedTokenizerBase":
         """# Associated Tokenizer"""
         return self._tokenizer_
     
     # METHODS ======================================================================================
 
-    @no_grad()
+    @_inference_mode_
     def generate(self,
         prompt: str,
         budget: Optional[int]
@@ -131,27 +229,19 @@ class Model(ABC):
                 * int:  Number of tokens generated.
         """
         # Tokenize prompt.
-        inputs:         Dict[str, Tensor] = self._tokenizer_(
+        inputs:         Dict[str, Tensor] = self._to_device_(self._tokenizer_(
                                                 text =              prompt,
                                                 return_tensors =    "pt"
-                                            ).to(self._device_)
+                                            ))
         
         # Record prompt length.
         prompt_length:  int =               inputs["input_ids"].shape[-1]
 
-        # Build generation arguments.
-        gen_kwargs:     Dict[str, Any] =    {
-                                                "do_sample":    False,
-                                                "temperature":  None,
-                                                "top_k":        None,
-                                                "top_p":        None
-                                            }
-
-        # If a token budget is defined...
-        if budget is not None: gen_kwargs["max_new_tokens"] = budget
-
         # Generate response.
-        output:     Tensor =                self._model_.generate(**inputs, **gen_kwargs)
+        output:     Tensor =                self._model_.generate(
+                                                **inputs,
+                                                **self._generation_kwargs_(budget = budget)
+                                            )
 
         # Record response length.
         token_count:    int =               output.shape[-1] - prompt_length
@@ -163,4 +253,187 @@ class Model(ABC):
                                             )
         
         # Provide response & token count.
-        return response, prompt_length, token_count
\ No newline at end of file
+        return response, prompt_length, token_count
+
+    @_inference_mode_
+    def generate_batch(self,
+        prompts:    List[str],
+        budget:     Optional[int]
+    ) -> List[Tuple[str, int, int]]:
+        """# Generate Responses from Batch of Prompts.
+
+        Batching amortizes kernel launch & KV-cache allocation overhead across prompts, keeping
+        the device saturated where one-prompt-at-a-time generation leaves it mostly idle.
+
+        ## Args:
+            * prompts   (List[str]):    Input prompt strings.
+            * budget    (int):          Token budget. None for unconstrained.
+
+        ## Returns:
+            * List[Tuple[str, int, int]]:   For each prompt, in order:
+                * str:  Generated response text (excluding prompt).
+                * int:  Token length of prompt.
+                * int:  Number of tokens generated.
+        """
+        # Tokenize prompts (left-padded, so generation continues from each prompt's final token).
+        inputs:         Dict[str, Tensor] = self._to_device_(self._tokenizer_(
+                                                text =              prompts,
+                                                return_tensors =    "pt",
+                                                padding =           True,
+                                                padding_side =      "left"
+                                            ))
+
+        # Record padded prompt length.
+        prompt_length:  int =               inputs["input_ids"].shape[-1]
+
+        # Record true (un-padded) prompt lengths.
+        prompt_lengths: List[int] =         inputs["attention_mask"].sum(dim = 1).tolist()
+
+        # Generate responses.
+        output:         Tensor =            self._model_.generate(
+                                                **inputs,
+                                                **self._generation_kwargs_(budget = budget)
+                                            )
+
+        # Isolate generated tokens (rows finishing early are right-padded by generate).
+        generated:      Tensor =            output[:, prompt_length:]
+
+        # Record response lengths, excluding right-padding, directly from the generation tensor.
+        token_counts:   List[int] =         (generated != self._tokenizer_.pad_token_id)   \
+                                                .sum(dim = 1).tolist()
+
+        # Decode responses (excluding prompt & padding tokens).
+        responses:      List[str] =         self._tokenizer_.batch_decode(
+                                                sequences =             generated,
+                                                skip_special_tokens =   True
+                                            )
+
+        # Provide responses & token counts, demultiplexed per prompt.
+        return list(zip(responses, prompt_lengths, token_counts))
+
+    @_inference_mode_
+    def generate_batch_sweep(self,
+        prompts:    List[str],
+        budgets:    List[Optional[int]]
+    ) -> Dict[Optional[int], List[Tuple[str, int, int]]]:
+        """# Generate Responses from Batch of Prompts Across Token Budgets.
+
+        Greedy decoding is prefix-deterministic: generation capped at budget B is exactly the
+        first B tokens of the uncapped generation. Sweeping budgets therefore needs only one
+        prefill & decode at the largest budget, with smaller budgets recovered by truncation —
+        rather than one full generation per budget.
+
+        ## Args:
+            * prompts   (List[str]):            Input prompt strings.
+            * budgets   (List[int | None]):     Token budgets to sweep. None for unconstrained.
+
+        ## Returns:
+            * Dict[int | None, List[Tuple[str, int, int]]]: For each budget, per prompt, in order:
+                * str:  Generated response text (excluding prompt).
+                * int:  Token length of prompt.
+                * int:  Number of tokens generated.
+        """
+        # Resolve governing budget (unconstrained, if requested, subsumes every finite budget).
+        cap:            Optional[int] =                     None                    \
+                                                            if None in budgets      \
+                                                            else max(budgets)
+
+        # Tokenize prompts (left-padded, so generation continues from each prompt's final token).
+        inputs:         Dict[str, Tensor] =                 self._to_device_(self._tokenizer_(
+                                                                text =              prompts,
+                                                                return_tensors =    "pt",
+                                                                padding =           True,
+                                                                padding_side =      "left"
+                                                            ))
+
+        # Record padded & true (un-padded) prompt lengths.
+        prompt_length:  int =                               inputs["input_ids"].shape[-1]
+        prompt_lengths: List[int] =                         inputs["attention_mask"]    \
+                                                                .sum(dim = 1).tolist()
+
+        # Generate responses at the governing budget.
+        generated:      Tensor =                            self._model_.generate(
+                                                                **inputs,
+                                                                **self._generation_kwargs_(
+                                                                    budget = cap
+                                                                )
+                                                            )[:, prompt_length:]
+
+        # Initialize sweep results.
+        sweep:          Dict[Optional[int],
+                             List[Tuple[str, int, int]]] =  {}
+
+        # For each budget being swept...
+        for budget in budgets:
+
+            # Truncate generation to budget (full width for unconstrained).
+            truncated:      Tensor =        generated                   \
+                                            if budget is None           \
+                                            else generated[:, :budget]
+
+            # Record response lengths, excluding right-padding.
+            token_counts:   List[int] =     (truncated != self._tokenizer_.pad_token_id)   \
+                                                .sum(dim = 1).tolist()
+
+            # Decode responses (excluding prompt & padding tokens).
+            responses:      List[str] =     self._tokenizer_.batch_decode(
+                                                sequences =             truncated,
+                                                skip_special_tokens =   True
+                                            )
+
+            # Record budget's results.
+            sweep[budget] =                 list(zip(responses, prompt_lengths, token_counts))
+
+        # Provide per-budget responses & token counts.
+        return sweep
+
+    # HELPERS ======================================================================================
+
+    def _generation_kwargs_(self,
+        budget: Optional[int]
+    ) -> Dict[str, Any]:
+        """# Resolve Generation Arguments for Token Budget.
+
+        ## Args:
+            * budget    (int):  Token budget. None for unconstrained.
+
+        ## Returns:
+            * Dict[str, Any]:   Cached generation arguments for the given budget.
+        """
+        # Query cache.
+        cached: Optional[Dict[str, Any]] =  self._gen_kwargs_cache_.get(budget)
+
+        # If budget's arguments have already been built, serve them.
+        if cached is not None: return cached
+
+        # Otherwise, extend defaults.
+        kwargs: Dict[str, Any] =            dict(self._gen_defaults_)
+
+        # If a token budget is defined...
+        if budget is not None: kwargs["max_new_tokens"] = budget
+
+        # Cache & provide budget's arguments.
+        return self._gen_kwargs_cache_.setdefault(budget, kwargs)
+
+    def _to_device_(self,
+        inputs: Any
+    ) -> Dict[str, "Tensor"]:
+        """# Transfer Tokenized Inputs to Device.
+
+        ## Args:
+            * inputs    (BatchEncoding):    Tokenizer output being transferred.
+
+        ## Returns:
+            * Dict[str, Tensor]:    Input tensors resident on the model's device.
+        """
+        # On CUDA, stage tensors in pinned host memory so the copy is asynchronous & overlaps
+        # with in-flight device work rather than serializing on PCIe.
+        if self._device_.type == "cuda":
+            return  {
+                        k: v.pin_memory().to(self._device_, non_blocking = True)
+                        for k, v
+                        in inputs.items()
+                    }
+
+        # Otherwise, plain transfer.
+        return inputs.to(self._device_)
\ No newline at end of file
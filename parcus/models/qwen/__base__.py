@@ -5,14 +5,16 @@ Qwen 2.5 model family.
 
 __all__ = ["Qwen"]
 
-from typing                         import Literal, Optional, Union
-
-from torch                          import device as t_device
+from typing                         import Literal, Optional, TYPE_CHECKING, Union
 
 from parcus.models.protocol         import Model
 from parcus.models.qwen.__args__    import QwenConfig
 from parcus.registration            import register_model
 
+# Defer until runtime.
+if TYPE_CHECKING:
+    from torch                      import device as t_device
+
 
 @register_model(
     id =        "qwen",
@@ -31,7 +33,8 @@ class Qwen(Model):
         max_memory:     Optional[int] =                                     None,
         load_in_4bit:   bool =                                              False,
         offload_path:   str =                                               "offload",
-        device:         Union[str, t_device] =                              "auto",
+        device:         Union[str, "t_device"] =                            "auto",
+        compile_model:  bool =                                              False,
         **kwargs
     ):
         """# Instantiate Qwen Model.
@@ -42,6 +45,7 @@ class Qwen(Model):
             * load_in_4bit  (bool):         Load model using 4-bit quantization.
             * offload_path  (str):          Folder for model offloads to share CPU RAM.
             * device        (str | device): Torch device. Defaults to "auto".
+            * compile_model (bool):         Compile model for fused decode kernels.
         """
         # Initialize model.
         super(Qwen, self).__init__(
@@ -50,5 +54,6 @@ class Qwen(Model):
             max_memory =    max_memory,
             load_in_4bit =  load_in_4bit,
             offload_path =  offload_path,
-            device =        device
+            device =        device,
+            compile_model = compile_model
         )
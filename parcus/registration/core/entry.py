@@ -37,8 +37,14 @@ class Entry(ABC):
         self._tags_:        List[str] =         tags
         self._config_:      Optional[Config] =  config
 
-        # Debug registration.
-        self.__logger__.debug(f"Registered {self}")
+        # Bind configuration registration to the applicable implementation once, so the hot
+        # argparse-setup loop dispatches without re-checking for a missing configuration.
+        self.register_configuration =           self._register_configuration_          \
+                                                if config is not None                   \
+                                                else self._report_missing_parser_
+
+        # Debug registration (lazily formatted to keep registration cheap when DEBUG is off).
+        self.__logger__.debug("Registered %s", self)
 
     # PROPERTIES ===================================================================================
 
@@ -70,34 +76,52 @@ class Entry(ABC):
         ## Returns:
             * bool: True if registration entry has specified tag.
         """
-        # Debug query.
-        self.__logger__.debug(f"{self} has tag {tag}? {tag in self._tags_}")
+        # Query tag once.
+        present:    bool =  tag in self._tags_
+
+        # Debug query (lazily formatted; this runs per entry in filtered listings).
+        self.__logger__.debug("%s has tag %s? %s", self, tag, present)
 
-        # Query tag.
-        return tag in self._tags_
+        # Provide query result.
+        return present
     
-    def register_configuration(self,
+    # HELPERS ======================================================================================
+
+    def _register_configuration_(self,
         subparser:  _SubParsersAction
     ) -> None:
         """# Register Configuration & Argument Handler.
 
+        Bound to `register_configuration` at instantiation when a configuration is present.
+
         ## Args:
-            * subparser (_SubParsersAction):    Sub-parser group of parent under which this entry's 
+            * subparser (_SubParsersAction):    Sub-parser group of parent under which this entry's
                                                 configuration will be registered.
-
-        ## Raises:
-            * ParserNotConfiguredError: If entry was not registered with a configuration & argument 
-                                        handler.
         """
-        # If entry was not registered with a configuration, report error.
-        if self._config_ is None: raise ParserNotConfiguredError(entry_id = self._id_)
-
-        # Debug registration.
-        self.__logger__.debug(f"Registering {self} configuration under {subparser.dest}")
+        # Debug registration (lazily formatted; this runs per entry during argparse setup).
+        self.__logger__.debug("Registering %s configuration under %s", self, subparser.dest)
 
         # Register configuration.
         self._config_.register(cls = self._config_, subparser = subparser)
 
+    def _report_missing_parser_(self,
+        subparser:  _SubParsersAction
+    ) -> None:
+        """# Report Missing Parser Configuration.
+
+        Bound to `register_configuration` at instantiation when no configuration was provided.
+
+        ## Args:
+            * subparser (_SubParsersAction):    Sub-parser group of parent under which registration
+                                                was attempted.
+
+        ## Raises:
+            * ParserNotConfiguredError: Entry was not registered with a configuration & argument
+                                        handler.
+        """
+        # Report error.
+        raise ParserNotConfiguredError(entry_id = self._id_)
+
     # DUNDERS ======================================================================================
 
     def __repr__(self) -> str:
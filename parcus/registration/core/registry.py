@@ -7,8 +7,11 @@ __all__ = ["Registry"]
 
 from abc                                    import ABC, abstractmethod
 from argparse                               import _SubParsersAction
+from collections                            import defaultdict
 from logging                                import Logger
-from typing                                 import Dict, List
+from typing                                 import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from types                                  import MappingProxyType
 
 from parcus.registration.core.entry         import Entry
 from parcus.registration.core.exceptions    import DuplicateEntryError, EntryNotFoundError
@@ -30,16 +33,19 @@ class Registry(ABC):
         self.__logger__:    Logger =            get_logger(f"{id}-registry")
 
         # Define properties.
-        self._id_:          str =               id
-        self._entries_:     Dict[str, Entry] =  {}
-        self._loaded_:      bool =              False
+        self._id_:              str =                       id
+        self._entries_:         Dict[str, Entry] =          {}
+        self._entries_view_:    Mapping[str, Entry] =       MappingProxyType(self._entries_)
+        self._tag_index_:       Dict[str, Set[str]] =       defaultdict(set)
+        self._ids_cache_:       Optional[Tuple[str, ...]] = None
+        self._loaded_:          bool =                      False
 
     # PROPERTIES ===================================================================================
 
     @property
-    def entries(self) -> Dict[str, Entry]:
-        """# Registered Entries"""
-        return self._entries_.copy()
+    def entries(self) -> Mapping[str, Entry]:
+        """# Registered Entries (Read-Only View)"""
+        return self._entries_view_
     
     @property
     def id(self) -> str:
@@ -70,49 +76,69 @@ class Registry(ABC):
         # Ensure that registry is loaded.
         self._ensure_loaded_()
 
+        # Bind entries locally to avoid repeated attribute resolution.
+        entries:    Dict[str, Entry] =  self._entries_
+
         # If queried entry is not registered...
-        if entry_id not in self._entries_:
+        if entry_id not in entries:
 
             # Report error.
             raise EntryNotFoundError(entry_id = entry_id, registry_id = self._id_)
-        
+
         # Debug query.
-        self.__logger__.debug(f"Entry queried: {entry_id}")
+        self.__logger__.debug("Entry queried: %s", entry_id)
 
         # Query entry.
-        return self._entries_[entry_id]
+        return entries[entry_id]
     
     def list_entries(self,
         filter_by:  List[str] = []
-    ) -> List[str]:
+    ) -> Sequence[str]:
         """# List Registered Entries.
 
         ## Args:
             * filter_by (List[str]):    Taxonomical keywords by which entries will be filtered.
 
         ## Returns:
-            * List[str]:    List of registered entry IDs.
+            * Sequence[str]:    Sequence of registered entry IDs.
         """
         # Ensure that registry is loaded.
         self._ensure_loaded_()
 
         # Debug action.
-        self.__logger__.debug(f"List entries filtered by {filter_by}")
-
-        # If no filter is provided, return all entries.
-        if len(filter_by) == 0: return list(self._entries_.keys())
-
-        # Otherwise, return filtered entries.
-        return  [
-                    id for id, entry
-                    in self._entries_.items()
-                    if  all(
-                            tag in entry.tags
-                            for tag
-                            in filter_by
-                        )
-                ]
+        self.__logger__.debug("List entries filtered by %s", filter_by)
+
+        # Bind entries locally to avoid repeated attribute resolution.
+        entries:    Dict[str, Entry] =  self._entries_
+
+        # If no filter is provided, serve the cached entry ID tuple (built on first request).
+        if len(filter_by) == 0:
+
+            # If cache is stale, rebuild it.
+            if self._ids_cache_ is None: self._ids_cache_ = tuple(entries)
+
+            # Provide cached IDs.
+            return self._ids_cache_
+
+        # If any requested tag is not indexed, no entry can match.
+        if any(tag not in self._tag_index_ for tag in filter_by): return []
+
+        # Intersect the indexed entry ID sets for the requested tags.
+        matched:    Set[str] =  set.intersection(*(self._tag_index_[tag] for tag in filter_by))
+
+        # Provide matched entries in registration order.
+        return [id for id in entries if id in matched]
     
+    def snapshot(self) -> Dict[str, Entry]:
+        """# Snapshot Registered Entries.
+
+        ## Returns:
+            * Dict[str, Entry]: Shallow copy of registered entries, safe against later
+                                registrations.
+        """
+        # Copy entries.
+        return self._entries_.copy()
+
     def register(self,
         entry_id:   str,
         **kwargs
@@ -125,17 +151,27 @@ class Registry(ABC):
         ## Raises:
             * DuplicateEntryError:  If entry is already registered.
         """
+        # Bind entries locally to avoid repeated attribute resolution.
+        entries:    Dict[str, Entry] =  self._entries_
+
         # If entry is already registered...
-        if entry_id in self._entries_:
+        if entry_id in entries:
 
             # Report duplication.
             raise DuplicateEntryError(entry_id = entry_id, registry_id = self._id_)
-        
+
         # Debug registration.
-        self.__logger__.debug(f"Registering {entry_id} with arguments: {kwargs}")
+        self.__logger__.debug("Registering %s with arguments: %s", entry_id, kwargs)
 
         # Create & register entry.
-        self._entries_[entry_id] = self._create_entry_(id = entry_id, **kwargs)
+        entry:  Entry =         self._create_entry_(id = entry_id, **kwargs)
+        entries[entry_id] =     entry
+
+        # Index entry under each of its tags for fast filtered listing.
+        for tag in entry.tags: self._tag_index_[tag].add(entry_id)
+
+        # Invalidate cached entry ID tuple.
+        self._ids_cache_ = None
 
     def register_configurations(self,
         subparser:  _SubParsersAction
@@ -152,8 +188,8 @@ class Registry(ABC):
         # For each registered entry...
         for entry in self._entries_.values():
 
-            # Debug action.
-            self.__logger__.debug(f"Registered configuration for {entry.id}")
+            # Debug action (lazily formatted; this is the hot per-entry argparse loop).
+            self.__logger__.debug("Registered configuration for %s", entry.id)
 
             # Register configuration.
             entry.register_configuration(subparser = subparser)
@@ -178,7 +214,7 @@ class Registry(ABC):
     def _import_all_modules_(self) -> None:
         """# Import All Applicable Modules."""
         from importlib  import import_module
-        from pkgutil    import walk_packages
+        from pkgutil    import iter_modules
         from types      import ModuleType
 
         try:# Import the main package to get its path.
@@ -189,33 +225,41 @@ class Registry(ABC):
 
             # Warn of complications.
             self.__logger__.warning(f"Error importing package parcus.{self._id_}: {e}"); return
-        
+
         # Debug action.
-        self.__logger__.debug(f"Walking package: {package}")
-
-        try:# For each module within package...
-            for _, module, _ in walk_packages(
-                path =      package.__path__,
-                prefix =    f"parcus.{self._id_}.",
-                onerror =   lambda x: None
-            ):
+        self.__logger__.debug(f"Scanning package: {package}")
+
+        # Seed scan with the root package path.
+        pending:    List[Tuple[List[str], str]] =   [
+                                                        (
+                                                            list(package.__path__),
+                                                            f"parcus.{self._id_}."
+                                                        )
+                                                    ]
+
+        # While package paths remain to be scanned...
+        while pending:
+
+            # Pop next path & prefix.
+            path, prefix =  pending.pop()
+
+            # For each module within package path...
+            for _, module, is_package in iter_modules(path = path, prefix = prefix):
+
                 try:# Attempt import of module.
-                    import_module(name = module)
+                    imported:   ModuleType =    import_module(name = module)
 
                     # Debug action.
-                    self.__logger__.debug(f"Walk of {module} complete")
+                    self.__logger__.debug(f"Imported {module}")
 
                 # If import error occurs...
                 except ImportError as e:
 
-                    # Warn of complications.
-                    self.__logger__.warning(f"Error importing {module}: {e}")
-
-        # If package cannot be imported...
-        except ImportError as e:
+                    # Warn of complications & skip descent.
+                    self.__logger__.warning(f"Error importing {module}: {e}"); continue
 
-            # Warn of error.
-            self.__logger__.warning(f"Error importing {package}: {e}")
+                # Queue sub-packages for scanning of their own modules.
+                if is_package: pending.append((list(imported.__path__), f"{module}."))
 
     def _load_all_(self) -> None:
         """# Load All Applicable Modules."""
@@ -9,10 +9,67 @@ __all__ =   [
                 "register_model",
             ]
 
-from typing                     import Callable, Type
+from functools                  import lru_cache
+from typing                     import Callable, Type, TYPE_CHECKING
 
 from parcus.configuration       import CommandConfig, DatasetConfig, ModelConfig
 
+# Defer until runtime.
+if TYPE_CHECKING:
+    from parcus.registration.registries import CommandRegistry, DatasetRegistry, ModelRegistry
+
+
+# HELPERS ==========================================================================================
+
+@lru_cache(maxsize = None)
+def _get_command_registry_() -> "CommandRegistry":
+    """# Get Command Registry.
+
+    Resolves the registry through the import system once, then serves repeat decorator calls from
+    the cache. The import must remain deferred to avoid a circular import with
+    `parcus.registration`.
+
+    ## Returns:
+        * CommandRegistry:  Global command registry.
+    """
+    from parcus.registration    import COMMAND_REGISTRY
+
+    return COMMAND_REGISTRY
+
+
+@lru_cache(maxsize = None)
+def _get_dataset_registry_() -> "DatasetRegistry":
+    """# Get Dataset Registry.
+
+    Resolves the registry through the import system once, then serves repeat decorator calls from
+    the cache. The import must remain deferred to avoid a circular import with
+    `parcus.registration`.
+
+    ## Returns:
+        * DatasetRegistry:  Global dataset registry.
+    """
+    from parcus.registration    import DATASET_REGISTRY
+
+    return DATASET_REGISTRY
+
+
+@lru_cache(maxsize = None)
+def _get_model_registry_() -> "ModelRegistry":
+    """# Get Model Registry.
+
+    Resolves the registry through the import system once, then serves repeat decorator calls from
+    the cache. The import must remain deferred to avoid a circular import with
+    `parcus.registration`.
+
+    ## Returns:
+        * ModelRegistry:    Global model registry.
+    """
+    from parcus.registration    import MODEL_REGISTRY
+
+    return MODEL_REGISTRY
+
+
+# DECORATORS =======================================================================================
 
 def register_command(
     id:     str,
@@ -36,11 +93,8 @@ def register_command(
         ## Args:
             * entry_point   (Callable): Command's main process entry point.
         """
-        # Load registry.
-        from parcus.registration    import COMMAND_REGISTRY
-
         # Register command.
-        COMMAND_REGISTRY.register(
+        _get_command_registry_().register(
             entry_id =      id,
             config =        config,
             entry_point =   entry_point
@@ -48,7 +102,7 @@ def register_command(
 
         # Expose entry point.
         return entry_point
-    
+
     # Expose decorator.
     return decorator
 
@@ -75,11 +129,8 @@ def register_dataset(
         ## Args:
             * cls   (Type): Dataset class being registered.
         """
-        # Load registry.
-        from parcus.registration    import DATASET_REGISTRY
-
         # Register dataset.
-        DATASET_REGISTRY.register(
+        _get_dataset_registry_().register(
             entry_id =      id,
             cls =           cls,
             config =        config,
@@ -87,7 +138,7 @@ def register_dataset(
 
         # Expose access point.
         return cls
-    
+
     # Expose decorator.
     return decorator
 
@@ -114,11 +165,8 @@ def register_model(
         ## Args:
             * cls   (Type): Model class being registered.
         """
-        # Load registry.
-        from parcus.registration    import MODEL_REGISTRY
-
         # Register model.
-        MODEL_REGISTRY.register(
+        _get_model_registry_().register(
             entry_id =      id,
             cls =           cls,
             config =        config,
@@ -126,6 +174,6 @@ def register_model(
 
         # Expose access point.
         return cls
-    
+
     # Expose decorator.
-    return decorator
\ No newline at end of file
+    return decorator
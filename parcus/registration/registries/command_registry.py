@@ -5,7 +5,7 @@ Command registry system.
 
 __all__ = ["CommandRegistry"]
 
-from typing                         import Any, Dict, override
+from typing                         import Any, Mapping, override
 
 from parcus.registration.core       import EntryPointNotConfiguredError, Registry
 from parcus.registration.entries    import CommandEntry
@@ -22,9 +22,9 @@ class CommandRegistry(Registry):
 
     @override
     @property
-    def entries(self) -> Dict[str, CommandEntry]:
-        """# Registered Command Entries"""
-        return self._entries_.copy()
+    def entries(self) -> Mapping[str, CommandEntry]:
+        """# Registered Command Entries (Read-Only View)"""
+        return self._entries_view_
 
     # METHODS ======================================================================================
 
@@ -51,7 +51,7 @@ class CommandRegistry(Registry):
         if entry.entry_point is None: raise EntryPointNotConfiguredError(entry_id = command_id)
 
         # Debug dispatch.
-        self.__logger__.debug(f"Dispatching {command_id}: {kwargs}")
+        self.__logger__.debug("Dispatching %s: %s", command_id, kwargs)
 
         # Dispatch command.
         return entry.entry_point(*args, **kwargs)
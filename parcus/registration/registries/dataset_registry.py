@@ -5,7 +5,7 @@ Dataset registry system.
 
 __all__ = ["DatasetRegistry"]
 
-from typing                         import Dict, override, TYPE_CHECKING
+from typing                         import Mapping, override, TYPE_CHECKING
 
 from parcus.registration.core       import Registry
 from parcus.registration.entries    import DatasetEntry
@@ -26,9 +26,9 @@ class DatasetRegistry(Registry):
 
     @override
     @property
-    def entries(self) -> Dict[str, DatasetEntry]:
-        """# Registered Dataset Entries"""
-        return self._entries_.copy()
+    def entries(self) -> Mapping[str, DatasetEntry]:
+        """# Registered Dataset Entries (Read-Only View)"""
+        return self._entries_view_
 
     # METHODS ======================================================================================
 
@@ -49,7 +49,7 @@ class DatasetRegistry(Registry):
         entry:  DatasetEntry =  self.get_entry(entry_id = dataset_id)
 
         # Debug loading.
-        self.__logger__.debug(f"Loading {dataset_id}: {kwargs}")
+        self.__logger__.debug("Loading %s: %s", dataset_id, kwargs)
 
         # Load dataset.
         return entry.cls(*args, **kwargs)
@@ -5,7 +5,7 @@ LLM model registry system.
 
 __all__ = ["ModelRegistry"]
 
-from typing                         import Dict, override, TYPE_CHECKING
+from typing                         import Mapping, override, TYPE_CHECKING
 
 from parcus.registration.core       import Registry
 from parcus.registration.entries    import ModelEntry
@@ -26,9 +26,9 @@ class ModelRegistry(Registry):
 
     @override
     @property
-    def entries(self) -> Dict[str, ModelEntry]:
-        """# Registered Model Entries"""
-        return self._entries_.copy()
+    def entries(self) -> Mapping[str, ModelEntry]:
+        """# Registered Model Entries (Read-Only View)"""
+        return self._entries_view_
     
     # METHODS ======================================================================================
 
@@ -48,8 +48,8 @@ class ModelRegistry(Registry):
         # Query for registered model.
         entry:  ModelEntry =    self.get_entry(entry_id = model_id)
 
-        # Debug loading.
-        self.__logger__.debug(f"Loading {model_id}: {kwargs}")
+        # Debug loading (keys only; values such as quantization configs render to large strings).
+        self.__logger__.debug("Loading %s: keys = %s", model_id, list(kwargs))
 
         # Load model.
         return entry.cls(*args, **kwargs)
@@ -8,6 +8,10 @@ __all__ =   [
                 "configure_logger",
                 "get_logger",
 
+                # Serialization
+                "dump_json",
+                "load_json",
+
                 # System
                 "determine_device",
                 "get_system_core_count",
@@ -17,6 +21,7 @@ __all__ =   [
                 "BANNER",
             ]
 
-from parcus.utilities.banner    import BANNER
-from parcus.utilities.logging   import *
-from parcus.utilities.system    import *
\ No newline at end of file
+from parcus.utilities.banner        import BANNER
+from parcus.utilities.logging       import *
+from parcus.utilities.serialization import *
+from parcus.utilities.system        import *
\ No newline at end of file
@@ -8,19 +8,20 @@ __all__ =   [
                 "get_logger"
             ]
 
+from atexit             import register
 from logging            import getLogger, Formatter, Logger, StreamHandler
-from logging.handlers   import RotatingFileHandler
+from logging.handlers   import QueueHandler, QueueListener, RotatingFileHandler
 from os                 import makedirs
+from queue              import SimpleQueue
 from sys                import stdout
-
-from transformers       import logging as hf_log
+from typing             import Optional
 
 
 # Declare base logger.
-LOGGER: Logger = getLogger(name = "parcus")
+LOGGER:     Logger =                    getLogger(name = "parcus")
 
-# Suppress HuggingFace warnings.
-hf_log.set_verbosity_error()
+# Declare background log listener (started by configure_logger).
+_LISTENER_: Optional[QueueListener] =   None
 
 
 def configure_logger(
@@ -37,11 +38,18 @@ def configure_logger(
     ## Returns:
         * Logger:   Base package logger after configuration.
     """
+    # Defer until configuration (importing transformers at module scope costs seconds cold, and
+    # commands that never touch a model should not pay it).
+    from transformers import logging as hf_log
+
+    # Suppress HuggingFace warnings.
+    hf_log.set_verbosity_error()
+
     # Ensure logging path exists.
     makedirs(name = logging_path, exist_ok = True)
     
-    # Declare global logger.
-    global LOGGER
+    # Declare global logger & listener.
+    global LOGGER, _LISTENER_
     
     # Set logging level.
     LOGGER.setLevel(level = logging_level)
@@ -60,9 +68,25 @@ def configure_logger(
     stdout_handler.setFormatter(fmt = Formatter(fmt = "%(levelname)s | %(name)s | %(message)s"))
     file_handler.setFormatter(  fmt = Formatter(fmt = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
     
-    # Add handlers to logger.
-    LOGGER.addHandler(hdlr = stdout_handler)
-    LOGGER.addHandler(hdlr = file_handler)
+    # Initialize record queue, through which producers hand off records without blocking on I/O.
+    record_queue:   SimpleQueue =           SimpleQueue()
+    
+    # Attach queue handler to logger, so log calls only enqueue.
+    LOGGER.addHandler(hdlr = QueueHandler(queue = record_queue))
+    
+    # Initialize listener, which drains the queue to the real handlers on a background thread.
+    _LISTENER_ =                            QueueListener(
+                                                record_queue,
+                                                stdout_handler,
+                                                file_handler,
+                                                respect_handler_level = True
+                                            )
+    
+    # Start listener.
+    _LISTENER_.start()
+    
+    # Ensure queued records are flushed at interpreter exit.
+    register(_LISTENER_.stop)
     
     # Return logger object.
     return LOGGER
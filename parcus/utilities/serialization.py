@@ -0,0 +1,65 @@
+"""# parcus.utilities.serialization
+
+Utility functions for (de)serializing results & reports.
+"""
+
+__all__ =   [
+                "dump_json",
+                "load_json",
+            ]
+
+from pathlib    import Path
+from typing     import Any, Union
+
+# Prefer orjson's C-level encoder when it is installed; otherwise fall back to the standard
+# library. Callers are agnostic to which backend serves them.
+try:                    import orjson as _orjson_
+except ImportError:     _orjson_ = None
+
+
+def dump_json(
+    obj:    Any,
+    path:   Union[str, Path]
+) -> None:
+    """# Serialize Object to JSON File.
+
+    ## Args:
+        * obj   (Any):          JSON-serializable object being written.
+        * path  (str | Path):   Path to which file will be written.
+    """
+    # If orjson is available...
+    if _orjson_ is not None:
+
+        # Encode & write bytes directly.
+        Path(path).write_bytes(_orjson_.dumps(obj, option = _orjson_.OPT_INDENT_2))
+
+        # Done.
+        return
+
+    from json   import dump
+
+    # Otherwise, open file...
+    with open(path, "w", encoding = "utf-8") as f:
+
+        # And write with the standard library encoder.
+        dump(obj = obj, fp = f, indent = 2, ensure_ascii = False)
+
+
+def load_json(
+    path:   Union[str, Path]
+) -> Any:
+    """# Deserialize Object from JSON File.
+
+    ## Args:
+        * path  (str | Path):   Path from which file will be read.
+
+    ## Returns:
+        * Any:  Deserialized file contents.
+    """
+    # If orjson is available, decode bytes directly.
+    if _orjson_ is not None: return _orjson_.loads(Path(path).read_bytes())
+
+    from json   import loads
+
+    # Otherwise, decode with the standard library.
+    return loads(Path(path).read_text(encoding = "utf-8"))
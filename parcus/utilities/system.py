@@ -10,19 +10,41 @@ __all__ =   [
                 "set_seed",
             ]
 
+from functools          import lru_cache
 from os                 import cpu_count
 from pathlib            import Path
 from random             import seed as r_seed
-from typing             import Literal, Optional, Union
+from typing             import Literal, Optional, TYPE_CHECKING, Union
 
-from numpy.random       import seed as np_seed
-from torch              import cuda, device as t_device, manual_seed
-from torch.backends     import cudnn
+# Defer until runtime (importing torch costs upwards of a second cold, and most commands never
+# touch a device).
+if TYPE_CHECKING:
+    from torch          import device as t_device
+
+# Track whether cuDNN determinism flags have been applied, so repeat seeding calls skip the
+# process-global configuration.
+_cudnn_configured_: bool =  False
+
+
+@lru_cache(maxsize = 1)
+def _cuda_available_() -> bool:
+    """# CUDA is Available?
+
+    Caches the driver query, which can cost milliseconds per call, so repeat checks are a simple
+    lookup.
+
+    ## Returns:
+        * bool: True if CUDA is available.
+    """
+    from torch              import cuda
+
+    # Query driver once.
+    return cuda.is_available()
 
 
 def determine_device(
-    device: Union[t_device, Literal["auto", "cpu", "cuda"]]
-) -> t_device:
+    device: Union["t_device", Literal["auto", "cpu", "cuda"]]
+) -> "t_device":
     """# Determine Data Processing Device.
 
     ## Args:
@@ -31,11 +53,16 @@ def determine_device(
     ## Returns:
         * t_device: Best available device based on provided choice.
     """
+    from torch              import device as t_device
+
+    # If a resolved device object is provided, simply return it.
+    if isinstance(device, t_device):    return device
+
     # If CPU is chosen, simply return CPU.
-    if device == "cpu":     return t_device("cpu")
+    if device == "cpu":                 return t_device("cpu")
 
     # Otherwise, if CUDA is available...
-    if cuda.is_available(): return t_device("cuda")
+    if _cuda_available_():              return t_device("cuda")
 
     # If CUDA, is not available, we're using CPU.
     return t_device("cpu")
@@ -47,11 +74,8 @@ def get_system_core_count() -> int:
     ## Returns:
         * (int):  Number of available CPU cores.
     """
-    # Count cores.
-    try:                return cpu_count() or 1
-
-    # Should any complications arise, default to 1.
-    except Exception:   return 1
+    # Count cores (cpu_count signals "undetermined" with None rather than raising).
+    return cpu_count() or 1
 
 
 def set_hugging_face_token(
@@ -102,16 +126,29 @@ def set_seed(
     ## Args:
         * seed  (int):  Random number generation seed.
     """
+    global _cudnn_configured_
+
+    from numpy.random       import seed as np_seed
+    from torch              import cuda, manual_seed
+    from torch.backends     import cudnn
+
     # Set seeds.
     r_seed(seed)
     np_seed(seed)
     manual_seed(seed)
 
     # If CUDA is available...
-    if cuda.is_available():
+    if _cuda_available_():
 
-        # Configure deterministic computing.
-        cuda.manual_seed(seed)
+        # Seed every device (manual_seed_all subsumes manual_seed on the current device).
         cuda.manual_seed_all(seed)
-        cudnn.deterministic =   True
-        cudnn.benchmark =       False
\ No newline at end of file
+
+        # If deterministic computing has not yet been configured...
+        if not _cudnn_configured_:
+
+            # Configure deterministic computing (process-global; only needs to happen once).
+            cudnn.deterministic =   True
+            cudnn.benchmark =       False
+
+            # Flag configuration as complete.
+            _cudnn_configured_ =    True
\ No newline at end of file
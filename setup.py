@@ -4,8 +4,8 @@ Package setup utility.
 """
 
 from pathlib    import Path
+from re         import search
 from setuptools import find_packages, setup
-from typing     import Any, Dict
 
 
 # HELPERS ==========================================================================================
@@ -25,17 +25,11 @@ def get_version() -> str:
     ## Returns:
         * str:  Current package version.
     """
-    # Initialize metadata mapping.
-    metadata:   Dict[str, Any] =    {}
-
-    # Open metadata file.
-    with open(Path(__file__).parent / "parcus" / "__meta__.py") as f:
-
-        # Map package data.
-        exec(f.read(), metadata)
-
-    # Provide package version.
-    return metadata["__version__"]
+    # Parse version directly, rather than executing the metadata file.
+    return search(
+        pattern =   r"""__version__\s*=\s*["']([^"']+)["']""",
+        string =    (Path(__file__).parent / "parcus" / "__meta__.py").read_text()
+    ).group(1)
 
 
 # SETUP UTILITY ====================================================================================